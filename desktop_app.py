@@ -5,15 +5,20 @@
 重複検出機能、範囲選択機能、プログレス表示機能を含みます。
 """
 
+import collections
+import multiprocessing
 import os
+import queue
 import threading
 import time
 import tkinter as tk
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
 from tkinter import ttk, filedialog, messagebox
-from typing import Optional, Tuple, Any
+from types import MappingProxyType
+from typing import Optional, Tuple, Any, List, NamedTuple, TYPE_CHECKING
 
-from screenshot_module import ScreenshotCapture
+if TYPE_CHECKING:
+    from screenshot_module import ScreenshotCapture
 
 
 class AppConfig:
@@ -40,12 +45,162 @@ class AppConfig:
     DEFAULT_DURATION = 300
     DEFAULT_INTERVAL = 5
     DEFAULT_SIMILARITY = 95
+    PNG_COMPRESS_LEVEL = 1  # PNG圧縮レベル（0-9、1はサイズ約2割増で5-10倍高速）
+    IMAGE_FORMAT = 'png'  # 保存形式（'png' または 'webp'。WebPは可逆圧縮でPNGより高速・小容量）
+    DEFERRED_ENCODE = False  # Trueで撮影中はlz4圧縮の生データのみ保存し、停止時に画像へ変換（要lz4）
 
     # UI設定
     MAIN_PADDING = "10"
     SECTION_PADDING = 8
     MAX_RECENT_ITEMS = 20
     PROGRESS_BAR_LENGTH = 400
+    UI_UPDATE_INTERVAL_MS = 50  # UI更新キューの処理間隔（ミリ秒）
+    UI_QUEUE_BATCH_SIZE = 50  # 1回の処理で取り出すUI更新の最大数
+    CAPTURE_RESULT_TIMEOUT = 30  # 撮影結果を待つ最小タイムアウト（秒、子プロセス起動時間を含む）
+
+
+class CaptureEvent(NamedTuple):
+    """1回の撮影結果と進捗情報（ワーカースレッドで一度だけ計算）"""
+
+    count: int  # 撮影数
+    elapsed: int  # 経過時間（秒）
+    remaining: int  # 残り時間（秒）
+    progress_tenths: int  # 進捗率（0.1%単位）
+    filename: Optional[str]  # 保存したファイル名（重複時はNone）
+    similarity: Optional[float]  # 重複時の類似度（重複でない場合はNone）
+    timestamp: str  # 撮影時刻（HH:MM:SS形式）
+
+
+# 撮影開始時に表示するプライバシー警告
+_PRIVACY_WARNING_TEXT = """⚠️ プライバシーとセキュリティに関する重要な警告 ⚠️
+
+このアプリケーションは画面の内容を撮影・保存します。
+以下の点にご注意ください：
+
+🔴 撮影禁止対象:
+• 個人情報（氏名、住所、電話番号等）
+• 金融情報（口座番号、クレジットカード等）
+• 企業の機密情報・顧客データ
+• ログイン情報・パスワード画面
+• 他人のプライベートな情報
+
+⚖️ 法的注意事項:
+• 各国の法律・規制を遵守してください
+• 企業での使用は事前に許可を得てください
+• 撮影による損害について開発者は責任を負いません
+
+🛡️ セキュリティ注意:
+• 画像は暗号化されずに保存されます
+• 定期的に不要なファイルを削除してください
+
+上記を理解し、責任を持って使用しますか？"""
+
+# セクション枠（tk.LabelFrame）の共通設定
+_SECTION_FONT = ('Arial', 10)
+_SECTION_KWARGS = MappingProxyType({
+    'bg': AppConfig.WARM_BEIGE,
+    'fg': AppConfig.DEEP_BROWN,
+    'font': _SECTION_FONT,
+    'bd': 1,
+    'relief': 'solid'
+})
+_SUBSECTION_KWARGS = MappingProxyType({**_SECTION_KWARGS, 'font': ('Arial', 9)})
+
+# 数値設定の定義: (行, ラベル, アプリ側の変数名, 初期値, 最小値, 最大値)
+_SPINBOX_SETTINGS: Tuple[Tuple[int, str, str, int, int, int], ...] = (
+    (3, "⏰ 実行時間 (秒):", 'duration_var', AppConfig.DEFAULT_DURATION, 1, 3600),
+    (4, "⏱️ 撮影間隔 (秒):", 'interval_var', AppConfig.DEFAULT_INTERVAL, 1, 60),
+    (7, "🔄 重複検出閾値 (%):", 'similarity_var', AppConfig.DEFAULT_SIMILARITY, 50, 99),
+)
+
+# ttkスタイル定義（インポート時に一度だけ構築し、全インスタンスで共有）
+_BASIC_STYLES: Tuple[Tuple[str, dict], ...] = (
+    ('TFrame', {
+        'background': AppConfig.WARM_BEIGE,
+        'relief': 'flat',
+        'borderwidth': 0
+    }),
+    ('TLabelFrame', {
+        'background': AppConfig.WARM_BEIGE,
+        'foreground': AppConfig.DEEP_BROWN,
+        'relief': 'flat',
+        'borderwidth': 1
+    }),
+    ('TLabelFrame.Label', {
+        'background': AppConfig.WARM_BEIGE,
+        'foreground': AppConfig.DEEP_BROWN
+    }),
+    ('TLabel', {
+        'background': AppConfig.WARM_BEIGE,
+        'foreground': AppConfig.DEEP_BROWN
+    }),
+    ('TEntry', {
+        'background': AppConfig.CREAM_WHITE,
+        'foreground': AppConfig.DEEP_BROWN,
+        'fieldbackground': AppConfig.CREAM_WHITE,
+        'borderwidth': 1
+    }),
+    ('TCombobox', {
+        'background': AppConfig.CREAM_WHITE,
+        'foreground': AppConfig.DEEP_BROWN,
+        'fieldbackground': AppConfig.CREAM_WHITE,
+        'borderwidth': 1
+    }),
+    ('TSpinbox', {
+        'background': AppConfig.CREAM_WHITE,
+        'foreground': AppConfig.DEEP_BROWN,
+        'fieldbackground': AppConfig.CREAM_WHITE,
+        'borderwidth': 1
+    }),
+    ('TProgressbar', {
+        'background': AppConfig.SOFT_PINK,
+        'troughcolor': AppConfig.WARM_BEIGE,
+        'borderwidth': 0
+    }),
+    ('TScrollbar', {
+        'background': AppConfig.SOFT_PINK,
+        'troughcolor': AppConfig.WARM_BEIGE,
+        'borderwidth': 0
+    }),
+    ('TButton', {
+        'background': AppConfig.SOFT_PINK,
+        'foreground': AppConfig.DEEP_BROWN,
+        'relief': 'raised',
+        'borderwidth': 1
+    }),
+)
+
+# 状態別の背景色
+_STATE_MAPS: Tuple[Tuple[str, list], ...] = (
+    ('TFrame', [('active', AppConfig.WARM_BEIGE), ('!active', AppConfig.WARM_BEIGE)]),
+    ('TLabelFrame', [('active', AppConfig.WARM_BEIGE), ('!active', AppConfig.WARM_BEIGE)]),
+    ('TLabelFrame.Label', [('active', AppConfig.WARM_BEIGE), ('!active', AppConfig.WARM_BEIGE)]),
+    ('TLabel', [('active', AppConfig.WARM_BEIGE), ('!active', AppConfig.WARM_BEIGE)]),
+    ('TButton', [
+        ('active', AppConfig.DUSTY_ROSE),
+        ('pressed', AppConfig.MAUVE_BROWN),
+        ('!active', AppConfig.SOFT_PINK)
+    ]),
+)
+
+# カスタムスタイル
+_CUSTOM_STYLES: Tuple[Tuple[str, dict], ...] = (
+    ('Header.TLabel', {
+        'font': ('Arial', 16, 'bold'),
+        'background': AppConfig.WARM_BEIGE,
+        'foreground': AppConfig.DEEP_BROWN
+    }),
+    ('Section.TLabel', {
+        'font': ('Arial', 12, 'bold'),
+        'background': AppConfig.WARM_BEIGE,
+        'foreground': AppConfig.DEEP_BROWN
+    }),
+    ('Status.TLabel', {
+        'font': _SECTION_FONT,
+        'background': AppConfig.WARM_BEIGE,
+        'foreground': AppConfig.DEEP_BROWN
+    }),
+)
 
 
 class AppStyleManager:
@@ -66,112 +221,12 @@ class AppStyleManager:
         self.style.theme_use('classic')
         self.root.configure(bg=AppConfig.WARM_BEIGE)
 
-        self._configure_basic_styles()
-        self._configure_button_styles()
-        self._configure_custom_styles()
-
-    def _configure_basic_styles(self) -> None:
-        """基本的なウィジェットのスタイルを設定"""
-        basic_styles = {
-            'TFrame': {
-                'background': AppConfig.WARM_BEIGE,
-                'relief': 'flat',
-                'borderwidth': 0
-            },
-            'TLabelFrame': {
-                'background': AppConfig.WARM_BEIGE,
-                'foreground': AppConfig.DEEP_BROWN,
-                'relief': 'flat',
-                'borderwidth': 1
-            },
-            'TLabelFrame.Label': {
-                'background': AppConfig.WARM_BEIGE,
-                'foreground': AppConfig.DEEP_BROWN
-            },
-            'TLabel': {
-                'background': AppConfig.WARM_BEIGE,
-                'foreground': AppConfig.DEEP_BROWN
-            },
-            'TEntry': {
-                'background': AppConfig.CREAM_WHITE,
-                'foreground': AppConfig.DEEP_BROWN,
-                'fieldbackground': AppConfig.CREAM_WHITE,
-                'borderwidth': 1
-            },
-            'TCombobox': {
-                'background': AppConfig.CREAM_WHITE,
-                'foreground': AppConfig.DEEP_BROWN,
-                'fieldbackground': AppConfig.CREAM_WHITE,
-                'borderwidth': 1
-            },
-            'TSpinbox': {
-                'background': AppConfig.CREAM_WHITE,
-                'foreground': AppConfig.DEEP_BROWN,
-                'fieldbackground': AppConfig.CREAM_WHITE,
-                'borderwidth': 1
-            },
-            'TProgressbar': {
-                'background': AppConfig.SOFT_PINK,
-                'troughcolor': AppConfig.WARM_BEIGE,
-                'borderwidth': 0
-            },
-            'TScrollbar': {
-                'background': AppConfig.SOFT_PINK,
-                'troughcolor': AppConfig.WARM_BEIGE,
-                'borderwidth': 0
-            }
-        }
-
-        for style_name, config in basic_styles.items():
+        for style_name, config in _BASIC_STYLES + _CUSTOM_STYLES:
             self.style.configure(style_name, **config)
 
-    def _configure_button_styles(self) -> None:
-        """ボタンスタイルの設定"""
-        self.style.configure('TButton',
-                             background=AppConfig.SOFT_PINK,
-                             foreground=AppConfig.DEEP_BROWN,
-                             relief='raised',
-                             borderwidth=1)
-
-        # ボタンの状態別スタイル
-        state_maps = {
-            'TFrame': [('active', AppConfig.WARM_BEIGE), ('!active', AppConfig.WARM_BEIGE)],
-            'TLabelFrame': [('active', AppConfig.WARM_BEIGE), ('!active', AppConfig.WARM_BEIGE)],
-            'TLabelFrame.Label': [('active', AppConfig.WARM_BEIGE), ('!active', AppConfig.WARM_BEIGE)],
-            'TLabel': [('active', AppConfig.WARM_BEIGE), ('!active', AppConfig.WARM_BEIGE)],
-            'TButton': [
-                ('active', AppConfig.DUSTY_ROSE),
-                ('pressed', AppConfig.MAUVE_BROWN),
-                ('!active', AppConfig.SOFT_PINK)
-            ]
-        }
-
-        for style_name, state_map in state_maps.items():
+        for style_name, state_map in _STATE_MAPS:
             self.style.map(style_name, background=state_map)
 
-    def _configure_custom_styles(self) -> None:
-        """カスタムスタイルの設定"""
-        custom_styles = {
-            'Header.TLabel': {
-                'font': ('Arial', 16, 'bold'),
-                'background': AppConfig.WARM_BEIGE,
-                'foreground': AppConfig.DEEP_BROWN
-            },
-            'Section.TLabel': {
-                'font': ('Arial', 12, 'bold'),
-                'background': AppConfig.WARM_BEIGE,
-                'foreground': AppConfig.DEEP_BROWN
-            },
-            'Status.TLabel': {
-                'font': ('Arial', 10),
-                'background': AppConfig.WARM_BEIGE,
-                'foreground': AppConfig.DEEP_BROWN
-            }
-        }
-
-        for style_name, config in custom_styles.items():
-            self.style.configure(style_name, **config)
-
 
 class GUIBuilder:
     """GUI構築を担当するクラス"""
@@ -186,6 +241,7 @@ class GUIBuilder:
         """
         self.parent = parent
         self.app = app_instance
+        self._reflow_id: Optional[str] = None
 
     def create_scrollable_main_frame(self) -> ttk.Frame:
         """
@@ -211,25 +267,45 @@ class GUIBuilder:
                                  scrollbar: ttk.Scrollbar) -> None:
         """スクロール可能フレームのイベントを設定"""
 
+        def apply_scrollregion():
+            # キャンバス内はscrollable_frameのみのため、bbox("all")で子要素を走査せずに算出
+            self._reflow_id = None
+            canvas.configure(scrollregion=(
+                0, 0,
+                max(canvas.winfo_width(), scrollable_frame.winfo_reqwidth()),
+                scrollable_frame.winfo_reqheight()))
+
+        def schedule_scrollregion():
+            # 連続したリサイズはアイドル時に1回だけ反映する
+            if self._reflow_id:
+                canvas.after_cancel(self._reflow_id)
+            self._reflow_id = canvas.after_idle(apply_scrollregion)
+
         def on_frame_configure(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
+            schedule_scrollregion()
 
         def on_canvas_configure(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas_width = event.width
-            canvas.itemconfig(window_id, width=canvas_width)
+            canvas.itemconfig(window_id, width=event.width)
+            schedule_scrollregion()
 
         def on_mousewheel(event):
             canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
+        def on_enter(event):
+            canvas.bind_all("<MouseWheel>", on_mousewheel)
+
+        def on_leave(event):
+            # 子ウィジェットへの移動ではキャンバス外に出ていないため解除しない
+            widget = canvas.winfo_containing(event.x_root, event.y_root)
+            if widget is None or not str(widget).startswith(str(canvas)):
+                canvas.unbind_all("<MouseWheel>")
+
         scrollable_frame.bind("<Configure>", on_frame_configure)
         window_id = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         canvas.bind('<Configure>', on_canvas_configure)
-        canvas.bind_all("<MouseWheel>", on_mousewheel)
-
-        # 初期化完了後にCanvasサイズを調整
-        self.parent.after(10, lambda: canvas.configure(scrollregion=canvas.bbox("all")))
+        canvas.bind('<Enter>', on_enter)
+        canvas.bind('<Leave>', on_leave)
 
     def _pack_scrollable_widgets(self, canvas: tk.Canvas, scrollbar: ttk.Scrollbar) -> None:
         """スクロール関連ウィジェットをパッキング"""
@@ -244,7 +320,7 @@ class GUIBuilder:
             parent: 親フレーム
         """
         header_frame = ttk.Frame(parent)
-        header_frame.grid(row=0, column=0, columnspan=2, pady=(0, 15), sticky=(tk.W, tk.E))
+        header_frame.grid(row=0, column=0, columnspan=2, pady=(0, 15), sticky='we')
 
         ttk.Label(header_frame, text=AppConfig.WINDOW_TITLE,
                   style='Header.TLabel').grid(row=0, column=0)
@@ -256,20 +332,16 @@ class GUIBuilder:
         Args:
             parent: 親フレーム
         """
-        settings_frame = tk.LabelFrame(parent, text="🛒 設定",
-                                       bg=AppConfig.WARM_BEIGE,
-                                       fg=AppConfig.DEEP_BROWN,
-                                       font=('Arial', 10),
-                                       bd=1, relief='solid')
+        settings_frame = tk.LabelFrame(parent, text="🛒 設定", **_SECTION_KWARGS)
         settings_frame.configure(padx=AppConfig.SECTION_PADDING,
                                  pady=AppConfig.SECTION_PADDING)
         settings_frame.grid(row=1, column=0, columnspan=2, pady=(0, 8),
-                            sticky=(tk.W, tk.E, tk.N))
+                            sticky='nwe')
 
         self._create_folder_settings(settings_frame)
-        self._create_timing_settings(settings_frame)
+        self._create_spinbox_settings(settings_frame)
         self._create_region_settings(settings_frame)
-        self._create_similarity_settings(settings_frame)
+        self._create_similarity_note(settings_frame)
 
         settings_frame.columnconfigure(0, weight=1)
 
@@ -279,11 +351,11 @@ class GUIBuilder:
         ttk.Label(parent, text="📁 保存先フォルダ:").grid(row=row, column=0, sticky=tk.W, pady=3)
 
         folder_frame = ttk.Frame(parent)
-        folder_frame.grid(row=row + 1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=3)
+        folder_frame.grid(row=row + 1, column=0, columnspan=3, sticky='we', pady=3)
 
         self.app.save_path_var = tk.StringVar(value=AppConfig.DEFAULT_SAVE_PATH)
         self.app.save_path_entry = ttk.Entry(folder_frame, textvariable=self.app.save_path_var, width=35)
-        self.app.save_path_entry.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
+        self.app.save_path_entry.grid(row=0, column=0, sticky='we', padx=(0, 5))
 
         ttk.Button(folder_frame, text="📁 参照",
                    command=self.app.browse_folder).grid(row=0, column=1, padx=5)
@@ -296,23 +368,14 @@ class GUIBuilder:
         self.app.folder_status_label = ttk.Label(parent, text="", foreground=AppConfig.SAGE_GREEN)
         self.app.folder_status_label.grid(row=row + 2, column=0, columnspan=3, sticky=tk.W, pady=3)
 
-    def _create_timing_settings(self, parent: tk.LabelFrame) -> None:
-        """タイミング設定UIを作成"""
-        # 実行時間
-        row = 3
-        ttk.Label(parent, text="⏰ 実行時間 (秒):").grid(row=row, column=0, sticky=tk.W, pady=3)
-        self.app.duration_var = tk.StringVar(value=str(AppConfig.DEFAULT_DURATION))
-        duration_spin = ttk.Spinbox(parent, from_=1, to=3600,
-                                    textvariable=self.app.duration_var, width=10)
-        duration_spin.grid(row=row, column=1, sticky=tk.W, pady=3)
-
-        # 撮影間隔
-        row += 1
-        ttk.Label(parent, text="⏱️ 撮影間隔 (秒):").grid(row=row, column=0, sticky=tk.W, pady=3)
-        self.app.interval_var = tk.StringVar(value=str(AppConfig.DEFAULT_INTERVAL))
-        interval_spin = ttk.Spinbox(parent, from_=1, to=60,
-                                    textvariable=self.app.interval_var, width=10)
-        interval_spin.grid(row=row, column=1, sticky=tk.W, pady=3)
+    def _create_spinbox_settings(self, parent: tk.LabelFrame) -> None:
+        """数値設定（スピンボックス）UIを_SPINBOX_SETTINGSの定義から作成"""
+        for row, label_text, var_name, default_value, from_, to in _SPINBOX_SETTINGS:
+            ttk.Label(parent, text=label_text).grid(row=row, column=0, sticky=tk.W, pady=3)
+            variable = tk.StringVar(value=str(default_value))
+            setattr(self.app, var_name, variable)
+            ttk.Spinbox(parent, from_=from_, to=to, textvariable=variable,
+                        width=10).grid(row=row, column=1, sticky=tk.W, pady=3)
 
     def _create_region_settings(self, parent: tk.LabelFrame) -> None:
         """撮影範囲設定UIを作成"""
@@ -320,7 +383,7 @@ class GUIBuilder:
         ttk.Label(parent, text="🔍 撮影範囲:").grid(row=row, column=0, sticky=tk.W, pady=3)
 
         region_frame = ttk.Frame(parent)
-        region_frame.grid(row=row + 1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=3)
+        region_frame.grid(row=row + 1, column=0, columnspan=3, sticky='we', pady=3)
 
         ttk.Button(region_frame, text="🎯 範囲選択",
                    command=self.app.select_region).grid(row=0, column=0, padx=(0, 5))
@@ -330,18 +393,11 @@ class GUIBuilder:
         self.app.region_info_label = ttk.Label(region_frame, text="全画面")
         self.app.region_info_label.grid(row=0, column=2, sticky=tk.W, padx=10)
 
-    def _create_similarity_settings(self, parent: tk.LabelFrame) -> None:
-        """重複検出設定UIを作成"""
-        row = 7
-        ttk.Label(parent, text="🔄 重複検出閾値 (%):").grid(row=row, column=0, sticky=tk.W, pady=3)
-        self.app.similarity_var = tk.StringVar(value=str(AppConfig.DEFAULT_SIMILARITY))
-        similarity_spin = ttk.Spinbox(parent, from_=50, to=99,
-                                      textvariable=self.app.similarity_var, width=10)
-        similarity_spin.grid(row=row, column=1, sticky=tk.W, pady=3)
-
+    def _create_similarity_note(self, parent: tk.LabelFrame) -> None:
+        """重複検出閾値の説明ラベルを作成"""
         ttk.Label(parent, text="この値以上に類似した画像は自動削除されます",
                   font=('Arial', 8), foreground=AppConfig.MUTED_GRAY).grid(
-            row=row + 1, column=0, columnspan=3, sticky=tk.W, pady=2)
+            row=8, column=0, columnspan=3, sticky=tk.W, pady=2)
 
     def create_control_section(self, parent: ttk.Frame) -> None:
         """
@@ -350,15 +406,11 @@ class GUIBuilder:
         Args:
             parent: 親フレーム
         """
-        control_frame = tk.LabelFrame(parent, text="🎮 実行コントロール",
-                                      bg=AppConfig.WARM_BEIGE,
-                                      fg=AppConfig.DEEP_BROWN,
-                                      font=('Arial', 10),
-                                      bd=1, relief='solid')
+        control_frame = tk.LabelFrame(parent, text="🎮 実行コントロール", **_SECTION_KWARGS)
         control_frame.configure(padx=AppConfig.SECTION_PADDING,
                                 pady=AppConfig.SECTION_PADDING)
         control_frame.grid(row=2, column=0, columnspan=2, pady=(0, 8),
-                           sticky=(tk.W, tk.E))
+                           sticky='we')
 
         button_frame = ttk.Frame(control_frame)
         button_frame.grid(row=0, column=0, pady=10)
@@ -380,15 +432,11 @@ class GUIBuilder:
         Args:
             parent: 親フレーム
         """
-        status_frame = tk.LabelFrame(parent, text="📊 撮影状況",
-                                     bg=AppConfig.WARM_BEIGE,
-                                     fg=AppConfig.DEEP_BROWN,
-                                     font=('Arial', 10),
-                                     bd=1, relief='solid')
+        status_frame = tk.LabelFrame(parent, text="📊 撮影状況", **_SECTION_KWARGS)
         status_frame.configure(padx=AppConfig.SECTION_PADDING,
                                pady=AppConfig.SECTION_PADDING)
         status_frame.grid(row=3, column=0, columnspan=2, pady=(0, 8),
-                          sticky=(tk.W, tk.E, tk.N, tk.S))
+                          sticky='nsew')
 
         self._create_status_info(status_frame)
         self._create_progress_bar(status_frame)
@@ -400,7 +448,7 @@ class GUIBuilder:
     def _create_status_info(self, parent: tk.LabelFrame) -> None:
         """ステータス情報UIを作成"""
         info_frame = ttk.Frame(parent)
-        info_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        info_frame.grid(row=0, column=0, columnspan=2, sticky='we', pady=(0, 10))
 
         status_items = [
             ("撮影状態:", "status_label", "待機中"),
@@ -418,14 +466,14 @@ class GUIBuilder:
     def _create_progress_bar(self, parent: tk.LabelFrame) -> None:
         """プログレスバーUIを作成"""
         progress_frame = ttk.Frame(parent)
-        progress_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
+        progress_frame.grid(row=1, column=0, columnspan=2, sticky='we', pady=10)
 
         self.app.progress_var = tk.DoubleVar()
         self.app.progress_bar = ttk.Progressbar(progress_frame,
                                                 variable=self.app.progress_var,
                                                 length=AppConfig.PROGRESS_BAR_LENGTH,
                                                 mode='determinate')
-        self.app.progress_bar.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 10))
+        self.app.progress_bar.grid(row=0, column=0, sticky='we', padx=(0, 10))
 
         self.app.progress_label = ttk.Label(progress_frame, text="0%")
         self.app.progress_label.grid(row=0, column=1)
@@ -435,23 +483,20 @@ class GUIBuilder:
     def _create_recent_captures(self, parent: tk.LabelFrame) -> None:
         """最新キャプチャ表示UIを作成"""
         recent_frame = tk.LabelFrame(parent, text="📷 最新のスクリーンショット",
-                                     bg=AppConfig.WARM_BEIGE,
-                                     fg=AppConfig.DEEP_BROWN,
-                                     font=('Arial', 9),
-                                     bd=1, relief='solid')
+                                     **_SUBSECTION_KWARGS)
         recent_frame.configure(padx=5, pady=5)
         recent_frame.grid(row=2, column=0, columnspan=2,
-                          sticky=(tk.W, tk.E, tk.N, tk.S), pady=(10, 0))
+                          sticky='nsew', pady=(10, 0))
 
         self.app.recent_listbox = tk.Listbox(recent_frame, height=6,
                                              bg=AppConfig.CREAM_WHITE,
                                              fg=AppConfig.DEEP_BROWN,
                                              selectbackground=AppConfig.SOFT_PINK)
-        self.app.recent_listbox.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.app.recent_listbox.grid(row=0, column=0, sticky='nsew')
 
         recent_scrollbar = ttk.Scrollbar(recent_frame, orient=tk.VERTICAL,
                                          command=self.app.recent_listbox.yview)
-        recent_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        recent_scrollbar.grid(row=0, column=1, sticky='ns')
         self.app.recent_listbox.configure(yscrollcommand=recent_scrollbar.set)
 
         recent_frame.columnconfigure(0, weight=1)
@@ -469,11 +514,27 @@ class ScreenshotController:
             app_instance: メインアプリケーションインスタンス
         """
         self.app = app_instance
-        self.screenshot_capture = ScreenshotCapture()
+        self._screenshot_capture: Optional['ScreenshotCapture'] = None
         self.is_capturing = False
         self.capture_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()  # 実行中のセッションの停止要求（セッションごとに生成）
         self.selected_region: Optional[Tuple[int, int, int, int]] = None
 
+    @property
+    def screenshot_capture(self) -> 'ScreenshotCapture':
+        """
+        スクリーンショット取得オブジェクト（初回アクセス時に生成）
+        
+        画像処理ライブラリの読み込みをウィンドウ表示後まで遅延させます。
+        
+        Returns:
+            ScreenshotCaptureインスタンス
+        """
+        if self._screenshot_capture is None:
+            from screenshot_module import ScreenshotCapture
+            self._screenshot_capture = ScreenshotCapture()
+        return self._screenshot_capture
+
     def select_region(self) -> None:
         """撮影範囲を選択"""
         try:
@@ -518,10 +579,14 @@ class ScreenshotController:
         try:
             # パラメータの取得と設定
             self._setup_capture_parameters()
+            executor = self._start_capture_process()
             self._update_ui_for_start()
 
-            # キャプチャスレッド開始
-            self.capture_thread = threading.Thread(target=self._capture_worker, daemon=True)
+            # キャプチャスレッド開始（子プロセスと停止要求はセッションごとにワーカーへ渡す）
+            self._stop_event = threading.Event()
+            self.capture_thread = threading.Thread(target=self._capture_worker,
+                                                   args=(executor, self._stop_event),
+                                                   daemon=True)
             self.capture_thread.start()
 
         except ValueError:
@@ -537,7 +602,59 @@ class ScreenshotController:
         similarity_threshold = int(self.app.similarity_var.get())
 
         self.screenshot_capture.setup(save_path, duration, interval,
-                                      self.selected_region, similarity_threshold)
+                                      self.selected_region, similarity_threshold,
+                                      AppConfig.PNG_COMPRESS_LEVEL,
+                                      AppConfig.IMAGE_FORMAT,
+                                      AppConfig.DEFERRED_ENCODE)
+
+    def _start_capture_process(self) -> ProcessPoolExecutor:
+        """
+        撮影用の子プロセスを準備
+        
+        撮影・PNGエンコード・重複判定を別プロセスで行い、
+        GUIのPythonインタプリタとCPU（GIL）を奪い合わないようにします。
+        Tk/X11の接続を持つマルチスレッドのプロセスからfork()すると子プロセスが
+        デッドロックする恐れがあるため、起動方式はどのOSでもspawnに固定します。
+        
+        Returns:
+            撮影用の子プロセスを持つExecutor
+        """
+        import screenshot_module
+
+        capture = self.screenshot_capture
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=screenshot_module.init_capture_process,
+            initargs=(capture.save_path, capture.duration, capture.interval,
+                      capture.region, capture.similarity_threshold,
+                      capture.compress_level, capture.image_format,
+                      capture.deferred_encode))
+
+    def _close_capture_process(self, executor: ProcessPoolExecutor, timeout: float) -> None:
+        """
+        撮影用の子プロセスを終了
+        
+        遅延エンコードが有効な場合、終了処理では撮影した全フレームを画像に変換するため、
+        タイムアウトせずに完了まで待機します。
+        
+        Args:
+            executor: 終了する子プロセスのExecutor
+            timeout: 終了処理の完了を待つ最大時間（秒、遅延エンコード時は無視）
+        """
+        import screenshot_module
+
+        if self.screenshot_capture.deferred_encode:
+            timeout = None
+
+        try:
+            executor.submit(screenshot_module.finish_capture_process).result(timeout=timeout)
+            finished = True
+        except Exception as e:
+            print(f"撮影プロセス終了エラー: {e}")
+            finished = False
+
+        executor.shutdown(wait=finished)
 
     def _update_ui_for_start(self) -> None:
         """撮影開始時のUI更新"""
@@ -548,64 +665,101 @@ class ScreenshotController:
         self.app.progress_var.set(0)
         
         # 最新のスクリーンショットリストをクリア
-        self.app.recent_listbox.delete(0, tk.END)
+        self.app.clear_recent_entries()
 
     def stop_capture(self) -> None:
-        """撮影を停止"""
-        if not self.is_capturing:
+        """
+        撮影を停止
+        
+        停止要求のみを送り、ワーカーの終了処理（保存待ちのファイルの書き出し）が終わって
+        'complete'イベントが届くまでは開始ボタンを無効のままにします。
+        """
+        if not self.is_capturing or self._stop_event.is_set():
             return
 
-        self.is_capturing = False
-        self.screenshot_capture.stop()
+        self._stop_event.set()
 
         # UI更新
-        self.app.start_button.config(state=tk.NORMAL)
+        self.app.start_button.config(state=tk.DISABLED)
         self.app.stop_button.config(state=tk.DISABLED)
         self.app.status_label.config(text="停止中...")
 
-    def _capture_worker(self) -> None:
-        """バックグラウンド撮影処理"""
-        start_time = time.time()
+    def _capture_worker(self, executor: ProcessPoolExecutor, stop_event: threading.Event) -> None:
+        """
+        バックグラウンド撮影処理
+        
+        Args:
+            executor: このセッション用の撮影子プロセス
+            stop_event: このセッションの停止要求
+        """
+        import screenshot_module
+
+        capture_timeout = max(self.screenshot_capture.interval * 2,
+                              AppConfig.CAPTURE_RESULT_TIMEOUT)
+        start_time = time.monotonic()
+        next_capture_time = start_time
         count = 0
         duplicate_count = 0
+        last_second = None
+        timestamp = ""
 
-        while self.is_capturing:
+        while not stop_event.is_set():
             try:
-                # スクリーンショット取得
-                result = self.screenshot_capture.capture()
+                # スクリーンショット取得（子プロセスで実行）
+                future = executor.submit(screenshot_module.capture_in_process)
+                result = future.result(timeout=capture_timeout)
 
                 # 結果の処理
                 filename, similarity = self._process_capture_result(result)
 
-                # 経過時間の計算（撮影結果に関係なく常に実行）
-                elapsed = time.time() - start_time
-                remaining = self.screenshot_capture.duration - elapsed
-                progress = (elapsed / self.screenshot_capture.duration) * 100
-
                 if filename is None:
                     # 重複検出の場合
                     duplicate_count += 1
-                    self.app.root.after(0, self.app.update_duplicate_status, similarity)
-                    # 重複の場合でも時間情報を更新
-                    self.app.root.after(0, self.app.update_time_info, int(elapsed), int(remaining), progress)
                 else:
                     # 正常撮影の場合
                     count += 1
-                    self.app.root.after(0, self.app.update_progress, count, int(elapsed),
-                                        int(remaining), progress, filename)
+
+                # 経過時間と進捗を一度だけ整数で計算（撮影結果に関係なく常に実行）
+                duration = self.screenshot_capture.duration
+                elapsed = time.monotonic() - start_time
+                elapsed_seconds = int(elapsed)
+
+                # 撮影時刻の文字列化（同じ秒の間は前回の文字列を再利用）
+                current_second = int(time.time())
+                if current_second != last_second:
+                    last_second = current_second
+                    timestamp = time.strftime('%H:%M:%S', time.localtime(current_second))
+
+                self.app.post_ui_event('capture', CaptureEvent(
+                    count=count,
+                    elapsed=elapsed_seconds,
+                    remaining=duration - elapsed_seconds,
+                    progress_tenths=int(elapsed * 1000) // duration,
+                    filename=filename,
+                    similarity=similarity,
+                    timestamp=timestamp))
 
                 # 終了チェック
-                if elapsed >= self.screenshot_capture.duration:
+                if elapsed >= duration:
                     break
 
-                time.sleep(self.screenshot_capture.interval)
+                # 次回撮影時刻まで待機（撮影時間による周期のずれを防ぎ、停止時は即座に抜ける）
+                # 撮影が間隔より長引いた場合は遅れた分を取り戻そうとせず、現在時刻から数え直す
+                next_capture_time = max(next_capture_time + self.screenshot_capture.interval,
+                                        time.monotonic())
+                if stop_event.wait(max(0.0, next_capture_time - time.monotonic())):
+                    break
 
+            except FuturesTimeoutError:
+                self.app.post_ui_event('error', "スクリーンショット取得がタイムアウトしました")
+                break
             except Exception as e:
-                self.app.root.after(0, self.app.show_error, str(e))
+                self.app.post_ui_event('error', str(e))
                 break
 
-        # 完了処理
-        self.app.root.after(0, self.app.capture_complete, count, duplicate_count)
+        # 完了処理（保存待ちのファイルを書き出してから完了を通知）
+        self._close_capture_process(executor, capture_timeout)
+        self.app.post_ui_event('complete', count, duplicate_count)
 
     def _process_capture_result(self, result: Any) -> Tuple[Optional[str], Optional[float]]:
         """
@@ -635,6 +789,10 @@ class ScreenshotApp:
             root: メインウィンドウ
         """
         self.root = root
+        self._ui_queue: queue.Queue = queue.Queue()
+        self._last_progress_state: Optional[Tuple[int, int, int]] = None
+        self._recent_deque: collections.deque = collections.deque(maxlen=AppConfig.MAX_RECENT_ITEMS)
+        self._validated_path: Optional[str] = None
         self._setup_window()
 
         # コンポーネントの初期化
@@ -646,6 +804,12 @@ class ScreenshotApp:
         # GUI作成
         self._create_gui()
 
+        # 保存先が変更されたら検証結果のキャッシュを破棄
+        self.save_path_var.trace_add('write', self._invalidate_validated_path)
+
+        # UI更新キューの定期処理を開始
+        self.root.after(AppConfig.UI_UPDATE_INTERVAL_MS, self._drain_ui_queue)
+
     def _setup_window(self) -> None:
         """ウィンドウの基本設定"""
         self.root.title(AppConfig.WINDOW_TITLE)
@@ -684,6 +848,10 @@ class ScreenshotApp:
         """
         folder_path = self.save_path_var.get()
 
+        # 検証済みのパスから変更がなければ再検証しない
+        if folder_path and folder_path == self._validated_path:
+            return True
+
         if not folder_path:
             self.folder_status_label.config(text="フォルダパスが入力されていません",
                                             foreground=AppConfig.RUST_RED)
@@ -693,6 +861,7 @@ class ScreenshotApp:
             if os.path.isdir(folder_path):
                 self.folder_status_label.config(text="✅ フォルダが見つかりました",
                                                 foreground=AppConfig.SAGE_GREEN)
+                self._validated_path = folder_path
                 return True
             else:
                 self.folder_status_label.config(text="指定されたパスはフォルダではありません",
@@ -703,6 +872,7 @@ class ScreenshotApp:
                 os.makedirs(folder_path, exist_ok=True)
                 self.folder_status_label.config(text="✅ フォルダを作成しました",
                                                 foreground=AppConfig.SAGE_GREEN)
+                self._validated_path = folder_path
                 return True
             except Exception as e:
                 self.folder_status_label.config(
@@ -710,6 +880,10 @@ class ScreenshotApp:
                     foreground=AppConfig.RUST_RED)
                 return False
 
+    def _invalidate_validated_path(self, *args: Any) -> None:
+        """保存先フォルダの検証結果キャッシュを破棄"""
+        self._validated_path = None
+
     def select_region(self) -> None:
         """撮影範囲を選択"""
         self.controller.select_region()
@@ -723,92 +897,103 @@ class ScreenshotApp:
         # プライバシー警告の表示
         if not self._show_privacy_warning():
             return
+        self._last_progress_state = None
         self.controller.start_capture()
         
     def _show_privacy_warning(self) -> bool:
         """プライバシー警告を表示"""
-        warning_text = """⚠️ プライバシーとセキュリティに関する重要な警告 ⚠️
+        return messagebox.askyesno("プライバシー警告", _PRIVACY_WARNING_TEXT)
 
-このアプリケーションは画面の内容を撮影・保存します。
-以下の点にご注意ください：
+    def stop_capture(self) -> None:
+        """撮影を停止"""
+        self.controller.stop_capture()
 
-🔴 撮影禁止対象:
-• 個人情報（氏名、住所、電話番号等）
-• 金融情報（口座番号、クレジットカード等）
-• 企業の機密情報・顧客データ
-• ログイン情報・パスワード画面
-• 他人のプライベートな情報
+    def post_ui_event(self, kind: str, *payload: Any) -> None:
+        """
+        UI更新イベントをキューに追加（ワーカースレッドから呼び出し可能）
+        
+        Args:
+            kind: イベント種別（'capture', 'error', 'complete'）
+            *payload: イベントの内容
+        """
+        self._ui_queue.put_nowait((kind, payload))
 
-⚖️ 法的注意事項:
-• 各国の法律・規制を遵守してください
-• 企業での使用は事前に許可を得てください
-• 撮影による損害について開発者は責任を負いません
+    def _drain_ui_queue(self) -> None:
+        """
+        UI更新キューをまとめて処理（メインスレッド）
+        
+        進捗は最新のもののみを反映し、リスト項目は一度にまとめて追加します。
+        """
+        latest_event = None
+        recent_entries = []
+        events = []
 
-🛡️ セキュリティ注意:
-• 画像は暗号化されずに保存されます
-• 定期的に不要なファイルを削除してください
+        for _ in range(AppConfig.UI_QUEUE_BATCH_SIZE):
+            try:
+                kind, payload = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
 
-上記を理解し、責任を持って使用しますか？"""
-        
-        return messagebox.askyesno("プライバシー警告", warning_text)
+            if kind == 'capture':
+                latest_event = payload[0]
+                if latest_event.filename is not None:
+                    recent_entries.append(f"{latest_event.timestamp} - {latest_event.filename}")
+                else:
+                    recent_entries.append(f"{latest_event.timestamp} - "
+                                          f"重複検出 (類似度: {latest_event.similarity:.1f}%)")
+            else:
+                events.append((kind, payload))
 
-    def stop_capture(self) -> None:
-        """撮影を停止"""
-        self.controller.stop_capture()
+        if latest_event is not None:
+            self.update_progress(latest_event)
+        if recent_entries:
+            self._add_recent_entries(recent_entries)
 
-    def update_progress(self, count: int, elapsed: int, remaining: int,
-                        progress: float, filename: str) -> None:
+        for kind, payload in events:
+            if kind == 'error':
+                self.show_error(*payload)
+            elif kind == 'complete':
+                self.capture_complete(*payload)
+
+        self.root.after(AppConfig.UI_UPDATE_INTERVAL_MS, self._drain_ui_queue)
+
+    def update_progress(self, event: CaptureEvent) -> None:
         """
         進捗を更新（メインスレッド）
         
-        Args:
-            count: 撮影数
-            elapsed: 経過時間
-            remaining: 残り時間
-            progress: 進捗率
-            filename: ファイル名
-        """
-        self.count_label.config(text=f"{count}枚")
-        self.elapsed_label.config(text=f"{elapsed}秒")
-        self.remaining_label.config(text=f"{remaining}秒")
-        self.progress_var.set(progress)
-        self.progress_label.config(text=f"{progress:.1f}%")
-
-        # 最新ファイルをリストに追加
-        if filename:
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            self.recent_listbox.insert(0, f"{timestamp} - {filename}")
-            self._limit_recent_list()
-
-    def update_duplicate_status(self, similarity: float) -> None:
-        """
-        重複検出ステータスを更新
+        表示内容が前回から変化していない場合はウィジェットを更新しません。
         
         Args:
-            similarity: 類似度
+            event: 撮影結果と進捗情報
         """
-        timestamp = datetime.now().strftime('%H:%M:%S')
-        self.recent_listbox.insert(0, f"{timestamp} - 重複検出 (類似度: {similarity:.1f}%)")
-        self._limit_recent_list()
+        state = (event.count, event.elapsed, event.progress_tenths)
+        if state == self._last_progress_state:
+            return
+        self._last_progress_state = state
 
-    def update_time_info(self, elapsed: int, remaining: int, progress: float) -> None:
+        self.count_label.config(text=f"{event.count}枚")
+        self.elapsed_label.config(text=f"{event.elapsed}秒")
+        self.remaining_label.config(text=f"{event.remaining}秒")
+        self.progress_var.set(event.progress_tenths / 10)
+        self.progress_label.config(text=f"{event.progress_tenths // 10}.{event.progress_tenths % 10}%")
+
+    def _add_recent_entries(self, entries: List[str]) -> None:
         """
-        時間情報のみを更新（重複検出時用）
+        最新リストに項目をまとめて追加
+        
+        リングバッファに追加した後、リストボックスを一度に再描画します。
         
         Args:
-            elapsed: 経過時間
-            remaining: 残り時間
-            progress: 進捗率
-        """
-        self.elapsed_label.config(text=f"{elapsed}秒")
-        self.remaining_label.config(text=f"{remaining}秒")
-        self.progress_var.set(progress)
-        self.progress_label.config(text=f"{progress:.1f}%")
-
-    def _limit_recent_list(self) -> None:
-        """最新リストの項目数を制限"""
-        if self.recent_listbox.size() > AppConfig.MAX_RECENT_ITEMS:
-            self.recent_listbox.delete(tk.END)
+            entries: 追加する項目（古い順）
+        """
+        self._recent_deque.extendleft(entries)
+        self.recent_listbox.delete(0, tk.END)
+        self.recent_listbox.insert(tk.END, *self._recent_deque)
+
+    def clear_recent_entries(self) -> None:
+        """最新リストをクリア"""
+        self._recent_deque.clear()
+        self.recent_listbox.delete(0, tk.END)
 
     def show_error(self, error_msg: str) -> None:
         """
@@ -5,23 +5,65 @@
 重複画像の検出・削除機能を提供します。
 """
 
+import hashlib
 import os
+import threading
+import time
 import tkinter as tk
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import messagebox
 from typing import Optional, Tuple, List
 
 import cv2
+import mss
 import numpy as np
 import pyautogui
 from PIL import Image, ImageTk
-from skimage.metrics import structural_similarity as ssim
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # 遅延エンコードを使わない場合は不要
+    lz4_frame = None
 
 # 定数定義
 DEFAULT_DURATION = 60  # デフォルト実行時間（秒）
 DEFAULT_INTERVAL = 5  # デフォルト間隔（秒）
 DEFAULT_SIMILARITY_THRESHOLD = 95  # デフォルト類似度閾値（%）
 MIN_REGION_SIZE = 1  # 最小領域サイズ（ピクセル）
+PHASH_IMAGE_SIZE = 32  # pHash計算時の縮小サイズ（ピクセル）
+PHASH_LOWFREQ_SIZE = 8  # pHashで使用する低周波成分のサイズ
+HASH_BITS = PHASH_LOWFREQ_SIZE * PHASH_LOWFREQ_SIZE  # ハッシュのビット数（64）
+DEFAULT_COMPRESS_LEVEL = 1  # デフォルトのPNG圧縮レベル（0-9、速度優先）
+DEFAULT_IMAGE_FORMAT = 'png'  # デフォルトの保存形式
+SUPPORTED_IMAGE_FORMATS = ('png', 'webp')  # 対応する保存形式（拡張子と同じ）
+WEBP_QUALITY = 80  # WebP可逆圧縮時の圧縮努力（0-100）
+WEBP_METHOD = 0  # WebPのエンコード方式（0-6、0が最速）
+SIGNATURE_GRID_SIZE = 15  # 厳密判定用の平均色グリッドのサイズ
+STRICT_SIGNATURE_TOLERANCE = 0  # 厳密判定で平均色グリッドによる不一致判定に使う許容差（合計）
+QUICK_CHECK_STRIDE = 16  # 静止画面の簡易判定で間引くピクセル間隔
+THUMBNAIL_SIZE = 64  # 平均絶対差（MAD）による事前判定用の縮小サイズ
+MAD_DUPLICATE_THRESHOLD = 1.0  # この値未満のMADはSSIMを計算せずに重複と判定
+MAD_UNIQUE_THRESHOLD = 15.0  # この値を超えるMADはSSIMを計算せずに重複なしと判定
+MAD_DUPLICATE_MAX_THRESHOLD = 95  # 類似度閾値がこれを超える場合はMADによる重複判定を行わない
+MAD_UNIQUE_MIN_THRESHOLD = 90  # 類似度閾値がこれ未満の場合はMADによる重複なし判定を行わない
+SSIM_WINDOW_SIZE = 7  # SSIMの窓サイズ（scikit-imageの既定値と同じ）
+SSIM_C1 = (0.01 * 255) ** 2  # SSIMの安定化定数C1（K1=0.01、8ビット画像）
+SSIM_C2 = (0.03 * 255) ** 2  # SSIMの安定化定数C2（K2=0.03、8ビット画像）
+COMPARE_MAX_SIZE = 512  # 重複判定用に縮小する際の長辺の最大サイズ（ピクセル）
+CROP_MATCH_TOLERANCE = 0.1  # サイズ差がこの割合以内なら縮小せず切り取りで揃える
+HSV_HISTOGRAM_BINS = (180, 256, 256)  # ヒストグラム比較で使うH・S・Vのビン数（OpenCVの値域）
+SAVE_WORKERS = 2  # 画像保存（エンコード・書き込み）を行うバックグラウンドスレッド数
+DEFERRED_SUFFIX = '.lz4'  # 遅延エンコード時の一時ファイル（lz4圧縮した生データ）の拡張子
+
+
+if hasattr(int, 'bit_count'):
+    def _popcount(value: int) -> int:
+        """立っているビット数を数えます（Python 3.10以降はC実装のpopcount）"""
+        return value.bit_count()
+else:
+    def _popcount(value: int) -> int:
+        """立っているビット数を数えます（Python 3.9以前用のフォールバック）"""
+        return bin(value).count('1')
 
 
 class ScreenshotCapture:
@@ -38,7 +80,25 @@ class ScreenshotCapture:
         region (Optional[List[int]]): キャプチャ領域 [x, y, width, height]
         is_running (bool): 実行状態フラグ
         similarity_threshold (int): 重複判定の類似度閾値（%）
-        last_screenshot_path (Optional[str]): 前回のスクリーンショットパス
+        compress_level (int): PNG保存時の圧縮レベル（0-9）
+        image_format (str): 保存形式（'png' または 'webp'）
+        deferred_encode (bool): 撮影中はlz4圧縮の生データのみ書き出し、停止時に画像へ変換するか
+        last_screenshot_path (Optional[str]): 前回のスクリーンショットパス（参照用。保存が完了しているとは限らない）
+        _last_hash (Optional[int]): 前回保存した画像の知覚ハッシュ（64ビット）
+        _last_signature (Optional[np.ndarray]): 前回保存した画像の平均色グリッド（厳密判定時のみ）
+        _last_quick (Optional[bytes]): 前回保存した画像の間引きサンプル（静止画面の簡易判定用）
+        _last_digest (Optional[bytes]): 前回保存した画像全体のダイジェスト（厳密判定時のみ）
+        _last_gray (Optional[np.ndarray]): 前回保存した画像の比較用グレースケール配列（長辺512以下に縮小済み）
+        _last_moments (Optional[Tuple[np.ndarray, ...]]): 前回保存した画像のSSIM用局所統計量（キャッシュ）
+        _last_thumb (Optional[np.ndarray]): 前回保存した画像の64x64縮小版（MAD事前判定用）
+        _thread_local (threading.local): スレッドごとのmssインスタンス保持領域
+        _screen_size (Optional[Tuple[int, int]]): キャッシュした画面サイズ（幅, 高さ）
+        _save_dir_prefix (str): 区切り文字付きの保存先ディレクトリパス（ファイルパス生成用）
+        _timestamp_second (Optional[int]): _timestamp_prefixを生成した時刻（エポック秒）
+        _timestamp_prefix (str): 秒単位までの整形済みタイムスタンプ
+        _io_pool (Optional[ThreadPoolExecutor]): 画像保存用のスレッドプール
+        _pending_saves (List[Future]): 完了を確認していない保存処理
+        _deferred_frames (List[Tuple[str, str, Tuple[int, ...]]]): 停止時に変換する一時ファイル・保存先・画像サイズ
     """
 
     def __init__(self) -> None:
@@ -53,14 +113,35 @@ class ScreenshotCapture:
         self.region: Optional[List[int]] = None
         self.is_running: bool = False
         self.similarity_threshold: int = DEFAULT_SIMILARITY_THRESHOLD
+        self.compress_level: int = DEFAULT_COMPRESS_LEVEL
+        self.image_format: str = DEFAULT_IMAGE_FORMAT
+        self.deferred_encode: bool = False
         self.last_screenshot_path: Optional[str] = None
+        self._last_hash: Optional[int] = None
+        self._last_signature: Optional[np.ndarray] = None
+        self._last_quick: Optional[bytes] = None
+        self._last_digest: Optional[bytes] = None
+        self._last_gray: Optional[np.ndarray] = None
+        self._last_moments: Optional[Tuple[np.ndarray, ...]] = None
+        self._last_thumb: Optional[np.ndarray] = None
+        self._thread_local = threading.local()
+        self._screen_size: Optional[Tuple[int, int]] = None
+        self._save_dir_prefix: str = ''
+        self._timestamp_second: Optional[int] = None
+        self._timestamp_prefix: str = ''
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_saves: List[Future] = []
+        self._deferred_frames: List[Tuple[str, str, Tuple[int, ...]]] = []
 
     def setup(self,
               save_path: str,
               duration: int,
               interval: int,
               region: Optional[List[int]] = None,
-              similarity_threshold: int = DEFAULT_SIMILARITY_THRESHOLD) -> None:
+              similarity_threshold: int = DEFAULT_SIMILARITY_THRESHOLD,
+              compress_level: int = DEFAULT_COMPRESS_LEVEL,
+              image_format: str = DEFAULT_IMAGE_FORMAT,
+              deferred_encode: bool = False) -> None:
         """
         キャプチャ設定を行います
         
@@ -70,20 +151,46 @@ class ScreenshotCapture:
             interval (int): キャプチャ間隔（秒）
             region (Optional[List[int]]): キャプチャ領域 [x, y, width, height]
             similarity_threshold (int): 重複判定の類似度閾値（%）
+            compress_level (int): PNG保存時の圧縮レベル（0-9、小さいほど高速）
+            image_format (str): 保存形式（'png' または 'webp'、WebPは可逆圧縮）
+            deferred_encode (bool): 画像へのエンコードを停止時にまとめて行うか
+                （lz4が必要。未インストールの場合は通常の保存にフォールバック）
+            
+        Raises:
+            ValueError: 対応していない保存形式が指定された場合
         """
+        if image_format not in SUPPORTED_IMAGE_FORMATS:
+            raise ValueError(f"対応していない保存形式です: {image_format}")
+
         self.save_path = save_path
+        self._save_dir_prefix = os.path.join(save_path, '')
         self.duration = duration
         self.interval = interval
         self.region = region
         self.similarity_threshold = similarity_threshold
+        self.compress_level = compress_level
+        self.image_format = image_format
+        if deferred_encode and lz4_frame is None:
+            print("lz4が見つからないため、遅延エンコードを無効にして保存します")
+            deferred_encode = False
+        self.deferred_encode = deferred_encode
         self.last_screenshot_path = None
+        self._last_hash = None
+        self._last_signature = None
+        self._last_quick = None
+        self._last_digest = None
+        self._last_gray = None
+        self._last_moments = None
+        self._last_thumb = None
+        self._screen_size = None
 
     def capture(self) -> Tuple[Optional[str], Optional[float]]:
         """
         スクリーンショットを取得します
         
         設定された領域（または全画面）のスクリーンショットを取得し、
-        前回の画像との類似度を比較して重複を検出します。
+        前回の画像と知覚ハッシュおよびSSIMで比較して重複を検出します。
+        比較はすべてメモリ上で行い、重複と判定された画像はディスクに保存しません。
         
         Returns:
             Tuple[Optional[str], Optional[float]]: 
@@ -94,38 +201,221 @@ class ScreenshotCapture:
             Exception: スクリーンショット取得に失敗した場合
         """
         try:
-            # タイムスタンプ付きファイル名を生成
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
-            filename = f"screenshot_{timestamp}.png"
-            filepath = os.path.join(self.save_path, filename)
-
-            # スクリーンショット取得
-            screenshot = self._take_screenshot()
-            screenshot.save(filepath)
-
+            # スクリーンショット取得（BGRAのndarray、mssのバッファをそのまま参照）
+            frame = self._take_screenshot()
         except Exception as e:
             print(f"スクリーンショット取得エラー: {e}")
             raise Exception(f"スクリーンショット取得に失敗しました: {str(e)}")
 
-        # 重複検出処理
-        return self._check_and_handle_duplicate(filename, filepath)
+        # 静止画面の簡易判定（間引きサンプルが前回と一致すればハッシュ計算を省略）
+        quick = None if self._is_strict() else self._quick_sample(frame)
+        if quick is not None and quick == self._last_quick:
+            return None, 100.0
+
+        # 重複検出処理（保存前に同じバッファからメモリ上で判定）
+        # 判定用のグレースケール画像は一度だけ縮小し、ハッシュ・MAD・SSIMで共用する
+        # カラー画像全体を読むのはこの変換の1回のみで、基準画像としてはグレースケールだけを保持する
+        # （先にBGRAのまま縮小するより、変換してから縮小する方が高速）
+        gray = self._prepare_for_compare(cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY))
+        image_hash = self.compute_perceptual_hash(gray)
+        signature = self.compute_color_signature(frame) if self._is_strict() else None
+        # 厳密判定では全画素のダイジェストで完全一致を確認する
+        digest = hashlib.blake2b(frame).digest() if self._is_strict() else None
+        thumb = cv2.resize(gray, (THUMBNAIL_SIZE, THUMBNAIL_SIZE), interpolation=cv2.INTER_AREA)
+        similarity = self._check_duplicate(image_hash, gray, thumb, signature, digest)
+        if similarity is not None:
+            return None, similarity  # 重複のため保存しない
+
+        try:
+            # タイムスタンプ付きファイル名を生成
+            filename = f"screenshot_{self._make_timestamp()}.{self.image_format}"
+            filepath = self._save_dir_prefix + filename
+
+            # 前回までの保存で発生したエラーを通知
+            self._collect_finished_saves()
+
+            # エンコードと書き込みはバックグラウンドで行い、撮影間隔への影響を避ける
+            # frameはmssが撮影ごとに確保するバッファを参照しており、以降書き換えられないためコピー不要
+            if self.deferred_encode:
+                # 撮影中は高速なlz4で生データのみ書き出し、画像への変換はstop()で行う
+                raw_path = filepath + DEFERRED_SUFFIX
+                future = self._get_io_pool().submit(self._write_deferred_frame, frame, raw_path)
+                self._deferred_frames.append((raw_path, filepath, frame.shape))
+            else:
+                future = self._get_io_pool().submit(self._save_frame, frame, filepath,
+                                                    self.image_format, self.compress_level)
+            self._pending_saves.append(future)
+
+        except Exception as e:
+            print(f"スクリーンショット保存エラー: {e}")
+            raise Exception(f"スクリーンショットの保存に失敗しました: {str(e)}")
+
+        self._last_hash = image_hash
+        self._last_signature = signature
+        self._last_quick = quick
+        self._last_digest = digest
+        self._last_gray = gray
+        self._last_moments = None  # 基準画像のSSIM用統計量は必要になった時点で計算
+        self._last_thumb = thumb
+        self.last_screenshot_path = filepath
+        return filename, None
+
+    def _make_timestamp(self) -> str:
+        """
+        ファイル名用のタイムスタンプ（YYYYmmdd_HHMMSS_ミリ秒）を生成します
+        
+        秒単位までの書式化は秒が変わったときだけ行い、
+        ミリ秒部分はtime.time_ns()の整数演算で付け加えます。
+        
+        Returns:
+            str: タイムスタンプ文字列
+        """
+        ns = time.time_ns()
+        second = ns // 1_000_000_000
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp_prefix = time.strftime("%Y%m%d_%H%M%S", time.localtime(second))
+        return f"{self._timestamp_prefix}_{ns // 1_000_000 % 1000:03d}"
+
+    @staticmethod
+    def _save_frame(frame: np.ndarray, filepath: str, image_format: str,
+                    compress_level: int) -> None:
+        """
+        BGRA配列を画像ファイルとして保存します（保存用スレッドで実行）
+        
+        Args:
+            frame (np.ndarray): 保存する画像（高さ x 幅 x 4 のBGRA配列）
+            filepath (str): 保存先のファイルパス
+            image_format (str): 保存形式（'png' または 'webp'）
+            compress_level (int): PNG保存時の圧縮レベル（0-9）
+        """
+        # BGRAからRGBへの並べ替えはPillowのデコーダ（BGRX）に任せる
+        # エンコード処理はPillowのC実装内でGILを解放して実行される
+        height, width = frame.shape[:2]
+        image = Image.frombuffer('RGB', (width, height), frame, 'raw', 'BGRX', 0, 1)
+        if image_format == 'webp':
+            # 可逆圧縮・最速のエンコード方式（PNGより高速かつ小さくなりやすい）
+            image.save(filepath, format='WEBP', lossless=True,
+                       quality=WEBP_QUALITY, method=WEBP_METHOD)
+        else:
+            image.save(filepath, format='PNG', optimize=False, compress_level=compress_level)
 
-    def _take_screenshot(self) -> Image.Image:
+    @staticmethod
+    def _write_deferred_frame(frame: np.ndarray, raw_path: str) -> None:
+        """
+        BGRA配列をlz4で圧縮して一時ファイルに書き出します（保存用スレッドで実行）
+        
+        Args:
+            frame (np.ndarray): 保存する画像（高さ x 幅 x 4 のBGRA配列）
+            raw_path (str): 一時ファイルのパス
+        """
+        with open(raw_path, 'wb') as f:
+            f.write(lz4_frame.compress(frame))
+
+    @staticmethod
+    def _encode_deferred_frame(raw_path: str, filepath: str, shape: Tuple[int, ...],
+                               image_format: str, compress_level: int) -> None:
+        """
+        lz4の一時ファイルを画像ファイルに変換し、一時ファイルを削除します
+        
+        Args:
+            raw_path (str): 一時ファイルのパス
+            filepath (str): 保存先のファイルパス
+            shape (Tuple[int, ...]): 画像の形状（高さ, 幅, 4）
+            image_format (str): 保存形式（'png' または 'webp'）
+            compress_level (int): PNG保存時の圧縮レベル（0-9）
+        """
+        with open(raw_path, 'rb') as f:
+            frame = np.frombuffer(lz4_frame.decompress(f.read()), dtype=np.uint8).reshape(shape)
+        ScreenshotCapture._save_frame(frame, filepath, image_format, compress_level)
+        os.remove(raw_path)
+
+    def _finalize_deferred_frames(self) -> None:
+        """遅延エンコードした一時ファイルをすべて画像ファイルに変換します"""
+        frames, self._deferred_frames = self._deferred_frames, []
+        if not frames:
+            return
+
+        with ThreadPoolExecutor(max_workers=SAVE_WORKERS) as pool:
+            futures = [pool.submit(self._encode_deferred_frame, raw_path, filepath, shape,
+                                   self.image_format, self.compress_level)
+                       for raw_path, filepath, shape in frames]
+
+        for future in futures:
+            if future.exception() is not None:
+                print(f"スクリーンショット変換エラー: {future.exception()}")
+
+    def _get_io_pool(self) -> ThreadPoolExecutor:
+        """
+        画像保存用のスレッドプールを取得します
+        
+        stop()で終了した後に再度撮影する場合に備え、必要になった時点で生成します。
+        
+        Returns:
+            ThreadPoolExecutor: 保存処理用のスレッドプール
+        """
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=SAVE_WORKERS)
+        return self._io_pool
+
+    def _collect_finished_saves(self) -> None:
+        """
+        完了した保存処理を取り除き、失敗していれば例外を送出します
+        
+        Raises:
+            Exception: バックグラウンドでの保存に失敗していた場合
+        """
+        pending = []
+        error = None
+        for future in self._pending_saves:
+            if not future.done():
+                pending.append(future)
+            elif error is None and future.exception() is not None:
+                error = future.exception()
+        self._pending_saves = pending
+
+        if error is not None:
+            raise error
+
+    def _take_screenshot(self) -> np.ndarray:
         """
         実際のスクリーンショット取得を行います
         
+        画面の取得はmss（ctypes経由のネイティブ呼び出し）で行うため、
+        取得中はGILが解放され、GUIスレッドの応答性が保たれます。
+        mssが返すBGRAの生バッファをコピーせずにndarrayとして参照します。
+        
         Returns:
-            Image.Image: 取得したスクリーンショット画像
+            np.ndarray: 取得したスクリーンショット画像（高さ x 幅 x 4 のBGRA配列）
         """
+        grabber = self._get_grabber()
+
         if self.region:
             # 指定範囲のスクリーンショット
-            validated_region = self._validate_region(self.region)
-            screenshot = pyautogui.screenshot(region=validated_region)
+            x, y, width, height = self._validate_region(self.region)
+            monitor = {'left': x, 'top': y, 'width': width, 'height': height}
         else:
-            # 全画面スクリーンショット
-            screenshot = pyautogui.screenshot()
+            # 全画面スクリーンショット（プライマリモニター）
+            monitor = grabber.monitors[1]
 
-        return screenshot
+        shot = grabber.grab(monitor)
+        return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+    def _get_grabber(self) -> 'mss.base.MSSBase':
+        """
+        現在のスレッド用のmssインスタンスを取得します
+        
+        mssのインスタンスはスレッド間で共有できないため、
+        スレッドごとに生成して再利用します。
+        
+        Returns:
+            mss.base.MSSBase: 画面取得用のmssインスタンス
+        """
+        grabber = getattr(self._thread_local, 'grabber', None)
+        if grabber is None:
+            grabber = mss.mss()
+            self._thread_local.grabber = grabber
+        return grabber
 
     def _validate_region(self, region: List[int]) -> Tuple[int, int, int, int]:
         """
@@ -137,49 +427,204 @@ class ScreenshotCapture:
         Returns:
             Tuple[int, int, int, int]: 修正された領域 (x, y, width, height)
         """
-        x, y, width, height = region
-
-        # 画面サイズを取得
-        screen_size = pyautogui.size()
-        screen_width, screen_height = screen_size.width, screen_size.height
+        screen = np.array(self._get_screen_size())
 
-        # 境界チェックと修正
-        x = max(0, min(x, screen_width - 1))
-        y = max(0, min(y, screen_height - 1))
+        # 境界チェックと修正（左上座標を画面内に収める）
+        position = np.clip(region[:2], 0, screen - 1)
 
-        # 幅と高さの修正
-        max_width = screen_width - x
-        max_height = screen_height - y
-        width = max(MIN_REGION_SIZE, min(width, max_width))
-        height = max(MIN_REGION_SIZE, min(height, max_height))
+        # 幅と高さの修正（画面の右端・下端を超えないようにする）
+        size = np.clip(region[2:], MIN_REGION_SIZE, screen - position)
 
+        x, y = position.tolist()
+        width, height = size.tolist()
         return (x, y, width, height)
 
-    def _check_and_handle_duplicate(self, filename: str, filepath: str) -> Tuple[Optional[str], Optional[float]]:
+    def _get_screen_size(self) -> Tuple[int, int]:
         """
-        重複画像の検出と処理を行います
+        画面サイズを取得します
+        
+        画面サイズの問い合わせはOSとの通信を伴うため、
+        初回のみ取得し、次にsetup()が呼ばれる（撮影セッションが変わる）まで再利用します。
+        
+        Returns:
+            Tuple[int, int]: 画面の幅と高さ
+        """
+        if self._screen_size is None:
+            screen_size = pyautogui.size()
+            self._screen_size = (screen_size.width, screen_size.height)
+        return self._screen_size
+
+    def _check_duplicate(self, image_hash: int, gray: np.ndarray, thumb: np.ndarray,
+                         signature: Optional[np.ndarray] = None,
+                         digest: Optional[bytes] = None) -> Optional[float]:
+        """
+        前回保存した画像と比較して重複かどうかを判定します
+        
+        知覚ハッシュの距離が閾値を超える場合は即座に重複なしと判定します。
+        閾値以内の場合は64x64縮小版の平均絶対差（MAD）で明らかな重複・非重複を判定し、
+        どちらとも言えない場合のみメモリ上のグレースケール画像でSSIMを計算します
+        （64ビットのハッシュでは数行の文字の変化を区別できないため）。
+        MADによる判定は固定の値で行うため、SSIMの判定結果と食い違わない閾値の範囲でのみ使います
+        （高い閾値では数行の文字の変化もSSIMで確認し、低い閾値では大きな変化もSSIMで確認します）。
+        閾値が100%の場合は、平均色グリッドの差で明らかな不一致を除外したうえで、
+        元の解像度のBGRA画像全体のダイジェストが一致するかを確認します
+        （平均色グリッドや縮小画像では1画素の違いを区別できないため）。
         
         Args:
-            filename (str): 新しいファイル名
-            filepath (str): 新しいファイルパス
+            image_hash (int): 新しい画像の知覚ハッシュ
+            gray (np.ndarray): 新しい画像の比較用グレースケール配列（縮小済み）
+            thumb (np.ndarray): 新しい画像の64x64縮小版
+            signature (Optional[np.ndarray]): 新しい画像の平均色グリッド（厳密判定時のみ）
+            digest (Optional[bytes]): 新しい画像全体のダイジェスト（厳密判定時のみ）
             
         Returns:
-            Tuple[Optional[str], Optional[float]]: ファイル名と類似度
+            Optional[float]: 重複の場合は類似度（0-100の範囲）、重複でない場合はNone
         """
-        if self.last_screenshot_path and os.path.exists(self.last_screenshot_path):
-            similarity = self.calculate_similarity(self.last_screenshot_path, filepath)
+        # 比較対象はメモリ上の前回画像のみ（保存済みファイルの存在確認は行わない）
+        if self._last_gray is None:
+            return None
 
-            if similarity >= self.similarity_threshold:
-                # 重複として削除
-                os.remove(filepath)
-                return None, similarity  # 削除されたことを示すためにNoneを返す
+        distance = self.hamming_distance(self._last_hash, image_hash)
+        if distance > self._threshold_bits():
+            return None
 
-        self.last_screenshot_path = filepath
-        return filename, None
+        if self._is_strict():
+            if signature is not None and self._last_signature is not None:
+                difference = np.abs(self._last_signature - signature).sum()
+                if difference > STRICT_SIGNATURE_TOLERANCE:
+                    return None
+            if digest is None or digest != self._last_digest:
+                return None
+            return 100.0
+
+        # 縮小版の平均絶対差による事前判定
+        mad = np.abs(thumb.astype(np.int16) - self._last_thumb).mean()
+        if mad < MAD_DUPLICATE_THRESHOLD and self.similarity_threshold <= MAD_DUPLICATE_MAX_THRESHOLD:
+            return (1 - distance / HASH_BITS) * 100
+        if mad > MAD_UNIQUE_THRESHOLD and self.similarity_threshold >= MAD_UNIQUE_MIN_THRESHOLD:
+            return None
+
+        similarity = self._ssim_arrays(self._last_gray, gray, self._reference_moments())
+        if similarity >= self.similarity_threshold:
+            return similarity
+
+        return None
+
+    def _threshold_bits(self) -> int:
+        """
+        類似度閾値（%）をハミング距離の許容ビット数に変換します
+        
+        Returns:
+            int: 重複とみなす最大ハミング距離（ビット）
+        """
+        threshold = min(100, max(0, self.similarity_threshold))
+        return int((100 - threshold) * HASH_BITS / 100)
+
+    def _is_strict(self) -> bool:
+        """
+        完全一致のみを重複とみなす設定かどうかを返します
+        
+        Returns:
+            bool: 類似度閾値が100%以上の場合True
+        """
+        return self.similarity_threshold >= 100
+
+    @staticmethod
+    def _prepare_for_compare(gray: np.ndarray) -> np.ndarray:
+        """
+        重複判定用に長辺がCOMPARE_MAX_SIZE以下になるよう縮小します
+        
+        同じ画面かどうかの判定には画素単位の精度は不要なため、
+        4K画面でもSSIMの計算量を数十分の一に抑えられます。
+        
+        Args:
+            gray (np.ndarray): 元のグレースケール画像
+            
+        Returns:
+            np.ndarray: 縮小したグレースケール画像（元が十分小さい場合はそのまま）
+        """
+        height, width = gray.shape[:2]
+        scale = COMPARE_MAX_SIZE / max(height, width)
+        if scale >= 1.0:
+            return gray
+        # 細長い領域でも縮小後の辺が0ピクセルにならないよう、出力サイズを明示する
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        return cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+
+    @staticmethod
+    def _quick_sample(frame: np.ndarray) -> bytes:
+        """
+        静止画面判定用に画像全体から一定間隔でピクセルを抜き出します
+        
+        画面の先頭・末尾だけでなく全体を格子状にサンプリングするため、
+        画面中央の変化も検出できます。
+        
+        Args:
+            frame (np.ndarray): 対象の画像
+            
+        Returns:
+            bytes: 間引いたピクセルのバイト列
+        """
+        return frame[::QUICK_CHECK_STRIDE, ::QUICK_CHECK_STRIDE].tobytes()
+
+    @staticmethod
+    def compute_perceptual_hash(gray: np.ndarray) -> int:
+        """
+        画像の知覚ハッシュ（pHash）を計算します
+        
+        32x32に縮小したグレースケール画像にDCTを適用し、
+        低周波8x8成分の中央値との大小で64ビットのハッシュを生成します。
+        
+        Args:
+            gray (np.ndarray): ハッシュを計算するグレースケール画像
+            
+        Returns:
+            int: 64ビットの知覚ハッシュ
+        """
+        small = cv2.resize(gray, (PHASH_IMAGE_SIZE, PHASH_IMAGE_SIZE),
+                           interpolation=cv2.INTER_AREA)
+        dct = cv2.dct(np.float32(small))
+        low_freq = dct[:PHASH_LOWFREQ_SIZE, :PHASH_LOWFREQ_SIZE]
+        bits = low_freq > np.median(low_freq)
+
+        # 64個の真偽値を8バイトに詰めて1つの整数に変換
+        return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+    @staticmethod
+    def compute_color_signature(frame: np.ndarray) -> np.ndarray:
+        """
+        画像の平均色グリッド（15x15、チャンネル数は入力画像と同じ）を計算します
+        
+        各セルの平均色をOpenCVの面積平均による縮小（INTER_AREA）でまとめて求めるため、
+        Pythonレベルのピクセルループは発生しません。
+        
+        Args:
+            frame (np.ndarray): 対象の画像
+            
+        Returns:
+            np.ndarray: int16の平均色グリッド
+        """
+        grid = cv2.resize(frame, (SIGNATURE_GRID_SIZE, SIGNATURE_GRID_SIZE),
+                          interpolation=cv2.INTER_AREA)
+        return grid.astype(np.int16)
+
+    @staticmethod
+    def hamming_distance(hash1: int, hash2: int) -> int:
+        """
+        2つのハッシュ間のハミング距離を計算します
+        
+        Args:
+            hash1 (int): ハッシュ1
+            hash2 (int): ハッシュ2
+            
+        Returns:
+            int: 異なるビットの数
+        """
+        return _popcount(hash1 ^ hash2)
 
     def calculate_similarity(self, image1_path: str, image2_path: str) -> float:
         """
-        2つの画像の類似度を計算します（構造的類似性指数を使用）
+        2つの画像ファイルの類似度を計算します（構造的類似性指数を使用）
         
         Args:
             image1_path (str): 比較する画像1のパス
@@ -188,23 +633,37 @@ class ScreenshotCapture:
         Returns:
             float: 類似度（0-100の範囲）
         """
-        try:
-            # 画像を読み込み
-            img1 = cv2.imread(image1_path)
-            img2 = cv2.imread(image2_path)
+        # グレースケールで直接読み込み
+        gray1 = cv2.imread(image1_path, cv2.IMREAD_GRAYSCALE)
+        gray2 = cv2.imread(image2_path, cv2.IMREAD_GRAYSCALE)
 
-            if img1 is None or img2 is None:
-                return 0.0
+        if gray1 is None or gray2 is None:
+            return 0.0
 
-            # グレースケールに変換
-            gray1 = cv2.cvtColor(img1, cv2.COLOR_BGR2GRAY)
-            gray2 = cv2.cvtColor(img2, cv2.COLOR_BGR2GRAY)
+        return self._ssim_arrays(gray1, gray2)
 
+    def _ssim_arrays(self, gray1: np.ndarray, gray2: np.ndarray,
+                     moments1: Optional[Tuple[np.ndarray, ...]] = None) -> float:
+        """
+        メモリ上の2つのグレースケール画像の類似度を計算します（SSIM）
+        
+        Args:
+            gray1 (np.ndarray): 比較するグレースケール画像1
+            gray2 (np.ndarray): 比較するグレースケール画像2
+            moments1 (Optional[Tuple[np.ndarray, ...]]): 画像1の計算済み局所統計量
+                （_ssim_momentsの戻り値。サイズが合わない場合は再計算）
+            
+        Returns:
+            float: 類似度（0-100の範囲）
+        """
+        try:
             # 画像サイズを統一
             gray1, gray2 = self._resize_images_to_match(gray1, gray2)
+            if moments1 is not None and moments1[0].shape != gray1.shape:
+                moments1 = None
 
             # 構造的類似性指数（SSIM）を計算
-            similarity_index = ssim(gray1, gray2)
+            similarity_index = self._ssim_fast(gray1, gray2, moments1)
 
             # パーセンテージに変換
             return similarity_index * 100
@@ -213,10 +672,123 @@ class ScreenshotCapture:
             print(f"類似度計算エラー: {e}")
             return 0.0
 
+    def _reference_moments(self) -> Tuple[np.ndarray, ...]:
+        """
+        前回保存した画像のSSIM用局所統計量を取得します
+        
+        基準画像は次に保存されるまで変わらないため、
+        初回の比較時に一度だけ計算して使い回します。
+        
+        Returns:
+            Tuple[np.ndarray, ...]: _ssim_momentsの戻り値
+        """
+        if self._last_moments is None:
+            self._last_moments = self._ssim_moments(self._last_gray)
+        return self._last_moments
+
+    @staticmethod
+    def _ssim_moments(gray: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        SSIMの計算に使う1枚分の局所統計量を整数のまま求めます
+        
+        窓内の画素値の和Sと二乗和Qを正規化なしのボックスフィルタで求めます
+        （uint8の二乗はuint16、窓内の和はint32に収まるため誤差なく計算できます）。
+        
+        Args:
+            gray (np.ndarray): グレースケール画像（uint8）
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+                元の画像、窓内の和S、S²、n・Q - S²（窓内の分散のn²倍）
+        """
+        window = (SSIM_WINDOW_SIZE, SSIM_WINDOW_SIZE)
+        n = SSIM_WINDOW_SIZE * SSIM_WINDOW_SIZE
+        total = cv2.boxFilter(gray, cv2.CV_32S, window, normalize=False,
+                              borderType=cv2.BORDER_REFLECT)
+        total_sq = total * total
+        variance = cv2.boxFilter(cv2.multiply(gray, gray, dtype=cv2.CV_16U), cv2.CV_32S, window,
+                                 normalize=False, borderType=cv2.BORDER_REFLECT)
+        variance *= n
+        variance -= total_sq
+        return gray, total, total_sq, variance
+
+    @staticmethod
+    def _ssim_fast(gray1: np.ndarray, gray2: np.ndarray,
+                   moments1: Optional[Tuple[np.ndarray, ...]] = None) -> float:
+        """
+        ボックスフィルタによる構造的類似性指数（SSIM）を計算します
+        
+        窓内の和（Sx, Sy）・二乗和・積和をcv2.boxFilterでint32のまま求め、
+        SSIMの式を和の形に変形して最後の積と除算だけをfloat32で評価します。
+        画像1の統計量が与えられた場合は再利用し、フィルタ処理を3回に減らします。
+        窓サイズ・標本共分散の補正・境界の除外はscikit-imageの既定の挙動に合わせています。
+        （既定は一様窓のため、ガウス窓は使いません。boxFilterは行・列に分離した累積和で
+        計算されるため、窓サイズによらず画素あたりの計算量は一定です。）
+        
+        Args:
+            gray1 (np.ndarray): 比較するグレースケール画像1（uint8）
+            gray2 (np.ndarray): 比較するグレースケール画像2（uint8）
+            moments1 (Optional[Tuple[np.ndarray, ...]]): 画像1の計算済み局所統計量（読み取りのみ）
+            
+        Returns:
+            float: SSIM（-1から1の範囲）
+        """
+        if moments1 is None:
+            moments1 = ScreenshotCapture._ssim_moments(gray1)
+        a, sum_a, sum_a_sq, var_a = moments1
+        b, sum_b, sum_b_sq, var_b = ScreenshotCapture._ssim_moments(gray2)
+
+        window = (SSIM_WINDOW_SIZE, SSIM_WINDOW_SIZE)
+        n = SSIM_WINDOW_SIZE * SSIM_WINDOW_SIZE
+        # μ = S/n の式全体をn²倍し、標本共分散の補正 n/(n-1) をC2側に移した定数
+        c1 = SSIM_C1 * n * n
+        c2 = SSIM_C2 * n * (n - 1)
+
+        # 共分散のn²倍: n・Σab - SaSb（int32で誤差なし）
+        sum_ab = sum_a * sum_b
+        cov_ab = cv2.boxFilter(cv2.multiply(a, b, dtype=cv2.CV_16U), cv2.CV_32S, window,
+                               normalize=False, borderType=cv2.BORDER_REFLECT)
+        cov_ab *= n
+        cov_ab -= sum_ab
+
+        # 以降は画像2側の配列をインプレースで再利用し、全画面サイズの一時配列を増やさない
+        # （画像1の統計量はキャッシュされている場合があるため書き換えない）
+        # 分子: (2SaSb + C1)(2共分散 + C2)
+        numerator = sum_ab.astype(np.float32)
+        numerator *= 2
+        numerator += c1
+        covariance = cov_ab.astype(np.float32)
+        covariance *= 2
+        covariance += c2
+        numerator *= covariance
+
+        # 分母: (Sa² + Sb² + C1)(分散a + 分散b + C2)
+        sum_b_sq += sum_a_sq
+        denominator = sum_b_sq.astype(np.float32)
+        denominator += c1
+        var_b += var_a
+        variance = var_b.astype(np.float32)
+        variance += c2
+        denominator *= variance
+
+        ssim_map = numerator
+        ssim_map /= denominator
+
+        # 境界の影響を受ける領域を除外して平均（窓より小さい画像は全体で平均）
+        pad = (SSIM_WINDOW_SIZE - 1) // 2
+        if ssim_map.shape[0] > 2 * pad and ssim_map.shape[1] > 2 * pad:
+            ssim_map = ssim_map[pad:-pad, pad:-pad]
+
+        return float(ssim_map.mean())
+
     def _resize_images_to_match(self, img1: np.ndarray, img2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
         2つの画像のサイズを統一します
         
+        領域のずれなどでサイズがわずかに異なるだけの場合は、
+        左上基準で小さい方に切り取ったビュー（コピーなし）を返します。
+        サイズ差が大きい場合のみ全体を縮小して揃えます。
+        
         Args:
             img1 (np.ndarray): 画像1
             img2 (np.ndarray): 画像2
@@ -228,8 +800,15 @@ class ScreenshotCapture:
             # より小さいサイズに合わせる
             h = min(img1.shape[0], img2.shape[0])
             w = min(img1.shape[1], img2.shape[1])
-            img1 = cv2.resize(img1, (w, h))
-            img2 = cv2.resize(img2, (w, h))
+            max_h = max(img1.shape[0], img2.shape[0])
+            max_w = max(img1.shape[1], img2.shape[1])
+
+            if h >= max_h * (1 - CROP_MATCH_TOLERANCE) and w >= max_w * (1 - CROP_MATCH_TOLERANCE):
+                img1 = img1[:h, :w]
+                img2 = img2[:h, :w]
+            else:
+                img1 = cv2.resize(img1, (w, h))
+                img2 = cv2.resize(img2, (w, h))
 
         return img1, img2
 
@@ -255,23 +834,64 @@ class ScreenshotCapture:
             hsv1 = cv2.cvtColor(img1, cv2.COLOR_BGR2HSV)
             hsv2 = cv2.cvtColor(img2, cv2.COLOR_BGR2HSV)
 
-            # ヒストグラムを計算
-            hist1 = cv2.calcHist([hsv1], [0, 1, 2], None, [50, 60, 60], [0, 180, 0, 256, 0, 256])
-            hist2 = cv2.calcHist([hsv2], [0, 1, 2], None, [50, 60, 60], [0, 180, 0, 256, 0, 256])
+            # チャンネルごとの1次元ヒストグラムを計算
+            hist1 = self._hsv_histogram(hsv1)
+            hist2 = self._hsv_histogram(hsv2)
 
-            # 相関係数で比較
-            correlation = cv2.compareHist(hist1, hist2, cv2.HISTCMP_CORREL)
+            # 相関係数（ピアソン）で比較
+            diff1 = hist1 - hist1.mean()
+            diff2 = hist2 - hist2.mean()
+            denominator = np.sqrt(np.dot(diff1, diff1) * np.dot(diff2, diff2))
+            if denominator == 0:
+                return 100.0 if np.array_equal(hist1, hist2) else 0.0
+            correlation = np.dot(diff1, diff2) / denominator
 
-            return correlation * 100
+            return float(correlation) * 100
 
         except Exception as e:
             print(f"ヒストグラム類似度計算エラー: {e}")
             return 0.0
 
+    @staticmethod
+    def _hsv_histogram(hsv: np.ndarray) -> np.ndarray:
+        """
+        H・S・Vそれぞれの1次元ヒストグラムを正規化して連結します
+        
+        整数画素値の度数はnp.bincountで直接数えるため、
+        3次元ヒストグラム（18万ビン）よりも大幅に高速です。
+        
+        Args:
+            hsv (np.ndarray): HSV色空間の画像
+            
+        Returns:
+            np.ndarray: 連結したヒストグラム（180 + 256 + 256要素）
+        """
+        histograms = []
+        for channel, bins in enumerate(HSV_HISTOGRAM_BINS):
+            counts = np.bincount(hsv[..., channel].ravel(), minlength=bins)
+            histograms.append(counts / counts.sum())
+        return np.concatenate(histograms)
+
     def stop(self) -> None:
-        """キャプチャを停止します"""
+        """
+        キャプチャを停止します
+        
+        バックグラウンドで実行中の保存処理がすべて完了するまで待機し、
+        遅延エンコードが有効な場合は一時ファイルを画像ファイルに変換します。
+        """
         self.is_running = False
 
+        io_pool, self._io_pool = self._io_pool, None
+        if io_pool is not None:
+            io_pool.shutdown(wait=True)
+
+        try:
+            self._collect_finished_saves()
+        except Exception as e:
+            print(f"スクリーンショット保存エラー: {e}")
+
+        self._finalize_deferred_frames()
+
     def select_region(self) -> Optional[List[int]]:
         """
         範囲選択GUIを表示します
@@ -291,6 +911,57 @@ class ScreenshotCapture:
             root.destroy()
 
 
+# 撮影用子プロセス内で使用するインスタンス（ProcessPoolExecutorのinitializerで生成）
+_process_capture: Optional[ScreenshotCapture] = None
+
+
+def init_capture_process(save_path: str,
+                         duration: int,
+                         interval: int,
+                         region: Optional[List[int]] = None,
+                         similarity_threshold: int = DEFAULT_SIMILARITY_THRESHOLD,
+                         compress_level: int = DEFAULT_COMPRESS_LEVEL,
+                         image_format: str = DEFAULT_IMAGE_FORMAT,
+                         deferred_encode: bool = False) -> None:
+    """
+    撮影用子プロセスを初期化します
+    
+    ProcessPoolExecutorのinitializerとして呼び出されます。
+    クロージャはプロセス間で受け渡せないため、インスタンスはモジュール変数に保持します。
+    
+    Args:
+        save_path (str): スクリーンショット保存先ディレクトリパス
+        duration (int): 実行時間（秒）
+        interval (int): キャプチャ間隔（秒）
+        region (Optional[List[int]]): キャプチャ領域 [x, y, width, height]
+        similarity_threshold (int): 重複判定の類似度閾値（%）
+        compress_level (int): PNG保存時の圧縮レベル（0-9）
+        image_format (str): 保存形式（'png' または 'webp'）
+        deferred_encode (bool): 画像へのエンコードを停止時にまとめて行うか
+    """
+    global _process_capture
+    _process_capture = ScreenshotCapture()
+    _process_capture.setup(save_path, duration, interval, region,
+                           similarity_threshold, compress_level, image_format,
+                           deferred_encode)
+
+
+def capture_in_process() -> Tuple[Optional[str], Optional[float]]:
+    """
+    撮影用子プロセス内でスクリーンショットを1枚取得します
+    
+    Returns:
+        Tuple[Optional[str], Optional[float]]: ファイル名と類似度（ScreenshotCapture.captureと同じ）
+    """
+    return _process_capture.capture()
+
+
+def finish_capture_process() -> None:
+    """撮影用子プロセス内のキャプチャを終了します"""
+    if _process_capture is not None:
+        _process_capture.stop()
+
+
 class RegionSelector:
     """
     画面範囲選択用のGUIクラス
@@ -330,7 +1001,7 @@ class RegionSelector:
         """
         try:
             # 全画面スクリーンショットを取得
-            screenshot = pyautogui.screenshot()
+            screenshot = self._grab_full()
 
             # 全画面ウィンドウを作成
             self._create_fullscreen_window()
@@ -357,6 +1028,20 @@ class RegionSelector:
                 self.root.destroy()
             raise Exception(f"範囲選択の初期化に失敗しました: {str(e)}")
 
+    def _grab_full(self) -> Image.Image:
+        """
+        プライマリモニター全体のスクリーンショットを取得します
+        
+        撮影時と同じくmssで取得し、BGRAの生データをPillowのデコーダでRGB画像に変換します。
+        範囲選択は撮影とは別のプロセス・スレッドで行われるため、mssは取得のたびに生成して閉じます。
+        
+        Returns:
+            Image.Image: 取得したスクリーンショット
+        """
+        with mss.mss() as grabber:
+            shot = grabber.grab(grabber.monitors[1])
+        return Image.frombuffer('RGB', shot.size, shot.raw, 'raw', 'BGRX', 0, 1)
+
     def _create_fullscreen_window(self) -> None:
         """全画面ウィンドウを作成します"""
         self.root = tk.Toplevel()
@@ -372,6 +1057,8 @@ class RegionSelector:
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
         # 画像をキャンバスに表示（参照を属性に保持してGCを防止）
+        # 範囲選択を開くたびに新しい画面を取得するため、内容をキーにしたキャッシュはほぼ一致せず、
+        # キーの計算にも取得済みの画像が必要になる。そのためPhotoImageはキャッシュせず毎回生成する
         screen_width = screenshot.width
         screen_height = screenshot.height
 